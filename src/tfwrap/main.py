@@ -1,8 +1,12 @@
 import argparse
+import concurrent.futures
+import functools
+import itertools
 import json
 import logging
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
@@ -10,10 +14,9 @@ import tempfile
 from datetime import datetime
 
 try:
-  import boto3
-  from botocore.exceptions import ClientError
-except Exception:
-  boto3 = None
+  import orjson
+except ImportError:
+  orjson = None
 
 from . import version
 
@@ -25,22 +28,157 @@ TARGET_DIR = os.environ.get('TARGET_DIR', '.')
 FORCE_COPY = False
 APP_NAME_OVERRIDE = ''
 FORCE_DELETE = False
+# Terraform's default of 10 under-uses provider RPC concurrency on most machines
+PARALLELISM = max(16, (os.cpu_count() or 4) * 3)
+
+# Shared botocore client settings; the pool is sized above S3_DELETE_WORKERS so the
+# bulk-delete threads never wait on a connection
+AWS_MAX_POOL_CONNECTIONS = 64
+AWS_CONNECT_TIMEOUT = 5
+AWS_READ_TIMEOUT = 30
+AWS_MAX_ATTEMPTS = 10
+
+# Bulk S3 delete tuning (delete_objects calls are network bound)
+S3_DELETE_WORKERS = 16
+S3_DELETE_MAX_IN_FLIGHT = 32
+
+# Pulls the bucket name out of the backend HCL stored in SSM
+_BUCKET_RE = re.compile(r'bucket\s*=\s*"([^"]+)"')
+
+# backend.tf templates
+_LOCAL_BACKEND = '''terraform {
+  backend "local" {
+    path = "bootstrap.tfstate"
+  }
+}
+'''
+
+_S3_BACKEND = '''terraform {{
+  backend "s3" {{
+    bucket = "{bucket}"
+    key    = "terraform.{account}-{region}-{app}.tfstate"
+    region = "{region}"
+    encrypt = true
+    use_lockfile = true
+  }}
+}}
+'''
 
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s')
 log = logging.info
 err = logging.error
 
+# boto3/botocore are imported on first AWS use (see _import_boto3) so commands such
+# as `clean` don't pay for loading them. Until then nothing can raise a ClientError,
+# so this placeholder only keeps the `except ClientError` clauses valid.
+boto3 = None
+Config = None
+
+
+class ClientError(Exception):
+  pass
+
+
+def _import_boto3():
+  global boto3, Config, ClientError
+  if boto3 is None:
+    import boto3 as _boto3
+    from botocore.config import Config as _Config
+    from botocore.exceptions import ClientError as _ClientError
+    boto3, Config, ClientError = _boto3, _Config, _ClientError
+  return boto3
+
+
+# Every child process is spawned with these. They are subprocess's defaults,
+# spelled out to document that children are started without a shell or
+# preexec_fn and all go through the same spawn settings.
+_SPAWN_KWARGS = {'close_fds': True, 'start_new_session': False}
+
+
+def _log_cmd(cmd, msg='CMD: %s', level=logging.INFO):
+  # Only build the quoted command line when the record would actually be emitted
+  if logging.getLogger().isEnabledFor(level):
+    logging.log(level, msg, ' '.join(shlex.quote(c) for c in cmd))
+
 
 def run_and_log(cmd, cwd=None, check=True):
-  log('CMD: %s', ' '.join(cmd))
+  _log_cmd(cmd)
   try:
-    subprocess.run(cmd, cwd=cwd, check=check)
+    subprocess.run(cmd, cwd=cwd, check=check, **_SPAWN_KWARGS)
   except subprocess.CalledProcessError:
-    err('Command failed: %s', ' '.join(cmd))
+    _log_cmd(cmd, 'Command failed: %s', logging.ERROR)
     if check:
       sys.exit(1)
 
 
+def run_terraform_json(cmd, cwd=None):
+  # Run a terraform command that was given -json, echoing the human-readable part
+  # of each message and returning the values from its "outputs" message (if any)
+  _log_cmd(cmd)
+  outputs = {}
+  with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, text=True, **_SPAWN_KWARGS) as proc:
+    for line in proc.stdout:
+      try:
+        msg = json.loads(line)
+      except ValueError:
+        msg = None
+      # Anything that is not a terraform message object is passed through untouched
+      if not isinstance(msg, dict):
+        sys.stdout.write(line)
+        continue
+      if msg.get('type') == 'outputs':
+        outputs = msg.get('outputs') or {}
+      if msg.get('@message'):
+        print(msg['@message'], flush=True)
+      detail = (msg.get('diagnostic') or {}).get('detail')
+      if detail:
+        print(detail, flush=True)
+  if proc.returncode != 0:
+    _log_cmd(cmd, 'Command failed: %s', logging.ERROR)
+    sys.exit(1)
+  return outputs
+
+
+def write_file_atomic(path, data):
+  # Write bytes to a temp file next to path and rename it into place, so an
+  # interrupted run never leaves a half-written file behind
+  dirpath = os.path.dirname(path) or '.'
+  flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+  while True:
+    tmp_path = os.path.join(dirpath, f'.tfwrap-{os.urandom(6).hex()}.tmp')
+    try:
+      # Created with 0o666 so the kernel applies the umask exactly as open() would
+      fd = os.open(tmp_path, flags, 0o666)
+      break
+    except FileExistsError:
+      continue
+  try:
+    # An existing file keeps its permissions across the replace
+    if hasattr(os, 'fchmod'):
+      try:
+        os.fchmod(fd, os.stat(path).st_mode & 0o7777)
+      except FileNotFoundError:
+        pass
+    view = memoryview(data)
+    while view:
+      view = view[os.write(fd, view):]
+    os.close(fd)
+    fd = None
+    os.replace(tmp_path, path)
+  except BaseException:
+    if fd is not None:
+      os.close(fd)
+    os.remove(tmp_path)
+    raise
+
+
+@functools.lru_cache(maxsize=8)
+def _load_props(path, mtime_ns):
+  # mtime_ns is only part of the cache key, so an edited file is parsed again
+  with open(path, 'rb') as f:
+    return (orjson or json).loads(f.read())
+
+
 def confirm_prompt(prompt):
   if FORCE_DELETE:
     return True
@@ -60,59 +198,92 @@ class TfWrap:
     self.force_copy = False
     self.app_name_override = ''
     self.force_delete = False
+    self.parallelism = PARALLELISM
+    self._local_backend_bytes = _LOCAL_BACKEND.encode('utf-8')
 
     self.app_name = ''
     self.safe_app_name = ''
     self.account_id = ''
     self.ssm_param_name = ''
-
-    # boto3 clients (created lazily)
+    self._ssm_backend_cache = None
+    self._bootstrap_dir = None
+    self._bucket_name = None
+
+    # boto3 module, session, shared client config and clients (created lazily)
+    self._boto3 = None
+    self._session = None
+    self._cfg = None
     self._ssm = None
     self._sts = None
     self._s3 = None
 
+  def _require_boto3(self, service):
+    if self._boto3 is None:
+      try:
+        self._boto3 = _import_boto3()
+      except ImportError:
+        err('boto3 is required for %s operations; please install boto3', service)
+        sys.exit(2)
+    return self._boto3
+
+  @property
+  def session(self):
+    # A single session resolves credentials once and shares loaded service models
+    # between clients; every client also shares the same Config
+    if self._session is None:
+      boto3 = self._require_boto3('AWS')
+      self._cfg = Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={'mode': 'adaptive', 'max_attempts': AWS_MAX_ATTEMPTS},
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=AWS_READ_TIMEOUT,
+      )
+      self._session = boto3.session.Session(region_name=self.region)
+    return self._session
+
   @property
   def ssm(self):
     if self._ssm is None:
-      if boto3 is None:
-        err('boto3 is required for SSM operations; please install boto3')
-        sys.exit(2)
-      self._ssm = boto3.client('ssm', region_name=self.region)
+      self._require_boto3('SSM')
+      self._ssm = self.session.client('ssm', config=self._cfg)
     return self._ssm
 
   @property
   def sts(self):
     if self._sts is None:
-      if boto3 is None:
-        err('boto3 is required for STS operations; please install boto3')
-        sys.exit(2)
+      self._require_boto3('STS')
       print(f'sts: {self.region}')
-      self._sts = boto3.client('sts', region_name=self.region)
+      self._sts = self.session.client('sts', config=self._cfg)
     return self._sts
 
   @property
   def s3(self):
     if self._s3 is None:
-      if boto3 is None:
-        err('boto3 is required for S3 operations; please install boto3')
-        sys.exit(2)
-      self._s3 = boto3.client('s3', region_name=self.region)
+      self._require_boto3('S3')
+      self._s3 = self.session.client('s3', config=self._cfg)
     return self._s3
 
+  @property
+  def bootstrap_dir(self):
+    # First existing candidate, resolved once; None (not cached) if there is none yet
+    if self._bootstrap_dir is None:
+      for d in (os.path.join(self.target_dir, 'bootstrap'), 'bootstrap'):
+        if os.path.isdir(d):
+          self._bootstrap_dir = d
+          break
+    return self._bootstrap_dir
+
   def synthesize_app_name_and_account(self):
     log('synthesize_app_name_and_account: BEGIN')
     if self.app_name_override:
       self.app_name = self.app_name_override
     else:
       props_path = f'properties.{self.env}.json'
-      if os.path.isfile(props_path):
-        try:
-          with open(props_path, 'r') as f:
-            props = json.load(f)
-            self.app_name = props.get('app_name', '')
-        except Exception:
-          self.app_name = ''
-      else:
+      try:
+        props = _load_props(props_path, os.stat(props_path).st_mtime_ns)
+        self.app_name = props.get('app_name', '')
+      except Exception:
         self.app_name = ''
 
     if not self.app_name:
@@ -135,9 +306,13 @@ class TfWrap:
     self.ssm_param_name = f"/terraform/backend/{self.account_id}-{self.safe_app_name}"
 
   def get_ssm_backend(self):
+    # destroy-all reads the same parameter twice; only successful reads are cached
+    if self._ssm_backend_cache is not None:
+      return self._ssm_backend_cache
     try:
       resp = self.ssm.get_parameter(Name=self.ssm_param_name, WithDecryption=True)
-      return resp['Parameter']['Value']
+      self._ssm_backend_cache = resp['Parameter']['Value']
+      return self._ssm_backend_cache
     except ClientError as e:
       if e.response['Error']['Code'] in ('ParameterNotFound',):
         return ''
@@ -145,6 +320,7 @@ class TfWrap:
       return ''
 
   def put_ssm_backend(self, value):
+    self._ssm_backend_cache = None
     try:
       self.ssm.put_parameter(Name=self.ssm_param_name, Value=value, Type='String', Overwrite=True)
     except ClientError as e:
@@ -153,6 +329,8 @@ class TfWrap:
 
   def delete_ssm_backend(self):
     log('delete_ssm_backend: BEGIN')
+    self._ssm_backend_cache = None
+    self._bucket_name = None
     try:
       self.ssm.delete_parameter(Name=self.ssm_param_name)
       log('Deleted SSM parameter %s', self.ssm_param_name)
@@ -162,34 +340,17 @@ class TfWrap:
   def write_backend_hcl_to_file(self, content):
     log('write_backend_hcl_to_file: BEGIN')
     out_path = os.path.join(self.target_dir, 'backend.tf')
-    with open(out_path, 'w') as f:
-      f.write(content)
+    write_file_atomic(out_path, content.encode('utf-8'))
     log('Wrote %s', out_path)
 
   def write_local_backend_tf(self, dirpath):
     log('write_local_backend_tf: BEGIN')
     backend_tf_path = os.path.join(dirpath, 'backend.tf')
-    content = '''terraform {
-  backend "local" {
-    path = "bootstrap.tfstate"
-  }
-}
-'''
-    with open(backend_tf_path, 'w') as f:
-      f.write(content)
+    write_file_atomic(backend_tf_path, self._local_backend_bytes)
     log('Wrote local backend.tf at %s', backend_tf_path)
 
   def build_backend_content(self, bucket, region, account):
-    return f'''terraform {{
-  backend "s3" {{
-    bucket = "{bucket}"
-    key    = "terraform.{account}-{region}-{self.safe_app_name}.tfstate"
-    region = "{region}"
-    encrypt = true
-    use_lockfile = true
-  }}
-}}
-'''
+    return _S3_BACKEND.format(bucket=bucket, account=account, region=region, app=self.safe_app_name)
 
   def erase_backend_tf(self, dirpath):
     log('erase_backend_tf: BEGIN')
@@ -207,34 +368,76 @@ class TfWrap:
 
     log('Emptying S3 bucket %s in region %s', bucket, region)
 
-    # Try simple recursive delete via CLI as a fast path (matching original behavior)
+    if self._boto3 is None:
+      try:
+        self._boto3 = _import_boto3()
+      except ImportError:
+        log('boto3 not available; skipping API-based emptying of bucket')
+        return
+
+    # Reuse the shared client (and its connection pool) unless another region was asked for
+    if region == self.region:
+      s3 = self.s3
+    else:
+      s3 = self.session.client('s3', region_name=region, config=self._cfg)
+
+    # A 'null' VersionId can only be dropped if versioning was never turned on;
+    # otherwise a key-only delete adds a delete marker instead of removing the object
     try:
-      run_and_log(['aws', 's3', 'rm', f's3://{bucket}', '--recursive', '--region', region], check=False)
-    except Exception:
-      pass
+      versioned = 'Status' in s3.get_bucket_versioning(Bucket=bucket)
+    except ClientError:
+      versioned = True
 
-    # Now ensure versioned objects and delete markers are removed via API
-    if boto3 is None:
-      log('boto3 not available; skipping API-based emptying of versions')
-      return
+    # Every object (current or noncurrent) and delete marker shows up as a version,
+    # so this covers unversioned buckets too. Pages are capped at 1000 entries,
+    # which matches the delete_objects limit, so each page is deleted as it lands.
+    paginator = s3.get_paginator('list_object_versions')
+    # Bind the client method once; it is looked up dynamically on every access
+    delete = s3.delete_objects
+    # In-flight delete_objects futures mapped to how many objects each one submitted
+    pending = {}
+    failed = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=S3_DELETE_WORKERS) as ex:
+      try:
+        for page in paginator.paginate(Bucket=bucket, PaginationConfig={'PageSize': 1000}):
+          objects = []
+          for v in itertools.chain(page.get('Versions', []), page.get('DeleteMarkers', [])):
+            version_id = v.get('VersionId')
+            if version_id and (versioned or version_id != 'null'):
+              objects.append({'Key': v['Key'], 'VersionId': version_id})
+            else:
+              objects.append({'Key': v['Key']})
+          if objects:
+            pending[ex.submit(delete, Bucket=bucket, Delete={'Objects': objects, 'Quiet': True})] = len(objects)
+          # Bound the number of in-flight pages so memory stays flat on huge buckets
+          if len(pending) > S3_DELETE_MAX_IN_FLIGHT:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for fut in done:
+              failed += self._drain_delete_result(bucket, fut, pending.pop(fut))
+      except ClientError:
+        log('list-object-versions failed or no versions; continuing')
 
-    s3 = boto3.client('s3', region_name=region)
+      for fut in concurrent.futures.as_completed(pending):
+        failed += self._drain_delete_result(bucket, fut, pending[fut])
 
-    paginator = s3.get_paginator('list_object_versions')
-    try:
-      for page in paginator.paginate(Bucket=bucket):
-        objects = []
-        for v in page.get('Versions', []) + page.get('DeleteMarkers', []):
-          objects.append({'Key': v['Key'], 'VersionId': v['VersionId']})
-        if objects:
-          for i in range(0, len(objects), 1000):
-            chunk = objects[i:i+1000]
-            s3.delete_objects(Bucket=bucket, Delete={'Objects': chunk, 'Quiet': False})
-    except ClientError:
-      log('list-object-versions failed or no versions; continuing')
+    if failed:
+      err('Failed to delete %d objects from S3 bucket %s', failed, bucket)
 
     log('empty_s3_bucket: DONE for %s', bucket)
 
+  # Returns the number of objects a finished delete_objects call failed to remove;
+  # if the whole call failed, that is every one of the `submitted` objects
+  def _drain_delete_result(self, bucket, fut, submitted):
+    try:
+      resp = fut.result()
+    except ClientError as e:
+      err('delete_objects failed for %d objects in bucket %s: %s', submitted, bucket, e)
+      return submitted
+    errors = resp.get('Errors', [])
+    for e in errors:
+      err('Failed to delete %s (version %s): %s', e.get('Key'), e.get('VersionId'), e.get('Message'))
+    return len(errors)
+
   def ensure_minimal_backend_tf(self, dirpath):
     log('ensure_minimal_backend_tf: BEGIN')
     backend_tf_path = os.path.join(dirpath, 'backend.tf')
@@ -395,49 +598,56 @@ variable "tags" {
 
   def run_bootstrap_and_create_ssm(self):
     log('run_bootstrap_and_create_ssm: BEGIN')
-    candidates = [os.path.join(self.target_dir, 'bootstrap'), 'bootstrap']
-    found = None
-    for d in candidates:
-      if os.path.isdir(d):
-        found = d
-        break
+    found = self.bootstrap_dir
 
     # If bootstrap directory doesn't exist, create it automatically
     if not found:
       log('Bootstrap directory not found. Auto-generating bootstrap infrastructure...')
-      found = self.create_bootstrap_directory()
+      found = self._bootstrap_dir = self.create_bootstrap_directory()
 
     log('Using bootstrap directory at %s. Running terraform init and apply...', found)
     self.erase_backend_tf(found)
 
     # terraform init/apply in bootstrap dir
     run_and_log(['terraform', 'init', '-input=false', '-reconfigure'], cwd=found)
-    run_and_log(['terraform', 'apply', '-auto-approve', '-input=false', '-var', f'environment={self.env}', '-var', f'region={self.region}'], cwd=found)
+    outputs = run_terraform_json(['terraform', 'apply', '-json', '-auto-approve', '-input=false', '-var', f'environment={self.env}', '-var', f'region={self.region}'], cwd=found)
     log('Bootstrap terraform apply completed in %s.', found)
 
     # Determine bucket name
     if self.bucket_override:
       bucket_name = self.bucket_override
     else:
-      # Try terraform output -json
-      bucket_name = ''
-      try:
-        out = subprocess.run(['terraform', 'output', '-json'], cwd=found, capture_output=True, text=True, check=True)
-        jout = json.loads(out.stdout)
-        if 'bucket_name' in jout and 'value' in jout['bucket_name']:
-          bucket_name = jout['bucket_name']['value']
-      except Exception:
-        pass
+      # Prefer the outputs apply already streamed; fall back to terraform output -json
+      bucket_name = (outputs.get('bucket_name') or {}).get('value', '')
+      if not bucket_name:
+        try:
+          cmd = ['terraform', 'output', '-json']
+          _log_cmd(cmd)
+          # Parse the raw bytes straight off the pipe rather than decoding a captured str first
+          with subprocess.Popen(cmd, cwd=found, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, **_SPAWN_KWARGS) as proc:
+            jout = (orjson or json).loads(proc.stdout.read())
+          if proc.returncode == 0 and 'bucket_name' in jout and 'value' in jout['bucket_name']:
+            bucket_name = jout['bucket_name']['value']
+        except Exception:
+          pass
       if not bucket_name:
         bucket_name = f"{self.account_id}-{self.safe_app_name}-tfstate"
+    self._bucket_name = bucket_name
 
     backend_content = self.build_backend_content(bucket_name, self.region, self.account_id)
+    # backend.tf is only written once SSM holds the same configuration, so a failed
+    # put never leaves a local backend that SSM has no record of
     self.put_ssm_backend(backend_content)
     log('Stored backend configuration into SSM parameter %s', self.ssm_param_name)
     self.write_backend_hcl_to_file(backend_content)
 
   def ensure_backend_via_ssm_or_bootstrap(self):
     log('ensure_backend_via_ssm_or_bootstrap: BEGIN')
+    # Bootstrap already ran in this process; rebuild its backend instead of asking SSM or terraform again
+    if self._bucket_name:
+      log('Using backend bucket %s from this run\'s bootstrap', self._bucket_name)
+      self.write_backend_hcl_to_file(self.build_backend_content(self._bucket_name, self.region, self.account_id))
+      return
     ssm_value = self.get_ssm_backend() or ''
     if ssm_value and ssm_value != 'None':
       log('Found backend configuration in SSM %s', self.ssm_param_name)
@@ -451,17 +661,12 @@ variable "tags" {
     log('Destroying top-level stack in %s', self.target_dir)
     self.ensure_backend_via_ssm_or_bootstrap()
     self.run_terraform_init_with_backend_file()
-    run_and_log(['terraform', 'destroy', '-auto-approve', '-var', f'environment={self.env}', '-var', f'region={self.region}'], cwd=self.target_dir)
+    run_and_log(['terraform', 'destroy', '-auto-approve', f'-parallelism={self.parallelism}', '-var', f'environment={self.env}', '-var', f'region={self.region}'], cwd=self.target_dir)
     log('Top-level stack destroyed.')
 
   def delete_bootstrap_stack(self):
     log('delete_bootstrap_stack: BEGIN')
-    candidates = [os.path.join(self.target_dir, 'bootstrap'), 'bootstrap']
-    found = None
-    for d in candidates:
-      if os.path.isdir(d):
-        found = d
-        break
+    found = self.bootstrap_dir
     if not found:
       log('Bootstrap directory not found; skipping bootstrap destroy.')
       return
@@ -470,7 +675,7 @@ variable "tags" {
     ssm_value = self.get_ssm_backend() or ''
 
     # Extract bucket name from HCL-like content
-    m = re.search(r'bucket\s*=\s*"([^"]+)"', ssm_value)
+    m = _BUCKET_RE.search(ssm_value)
     bucket_name = m.group(1) if m else f"{self.account_id}-{self.safe_app_name}-tfstate"
 
     # Remove SSM param
@@ -499,45 +704,62 @@ variable "tags" {
     log('Cleaning Terraform files and directories from %s', self.target_dir)
 
     # Patterns to remove
-    dirs_to_remove = ['.terraform']
-    files_to_remove = ['.terraform.lock.hcl', 'backend.tf', 'terraform.tfstate', 'terraform.tfstate.backup']
+    dirs_to_remove = frozenset(['.terraform'])
+    files_to_remove = frozenset(['.terraform.lock.hcl', 'backend.tf', 'terraform.tfstate', 'terraform.tfstate.backup'])
 
     removed_count = 0
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-    for root, dirs, files in os.walk(self.target_dir, topdown=False):
-      # Remove matching directories
-      for dirname in dirs:
-        if dirname in dirs_to_remove:
-          dir_path = os.path.join(root, dirname)
-          try:
-            shutil.rmtree(dir_path)
-            log('Removed directory: %s', dir_path)
-            removed_count += 1
-          except Exception as e:
-            err('Failed to remove directory %s: %s', dir_path, e)
+    # Depth-first walk with scandir; directories that get removed are never descended
+    # into, so provider caches under .terraform/ are not listed or stat'ed first
+    stack = [self.target_dir]
+    while stack:
+      root = stack.pop()
+      try:
+        with os.scandir(root) as it:
+          entries = list(it)
+      except OSError as e:
+        err('Failed to scan directory %s: %s', root, e)
+        continue
+
+      local_n = 0
+      for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+          # Remove matching directories
+          if entry.name in dirs_to_remove:
+            try:
+              shutil.rmtree(entry.path)
+              log('Removed directory: %s', entry.path)
+              removed_count += 1
+            except Exception as e:
+              err('Failed to remove directory %s: %s', entry.path, e)
 
-        # Remove auto-generated bootstrap directories
-        elif dirname == 'bootstrap':
-          bootstrap_path = os.path.join(root, dirname)
-          marker_file = os.path.join(bootstrap_path, '.tfwrap-autogenerated')
-          if os.path.isfile(marker_file):
+          # Remove auto-generated bootstrap directories
+          elif entry.name == 'bootstrap' and os.path.isfile(os.path.join(entry.path, '.tfwrap-autogenerated')):
             try:
-              shutil.rmtree(bootstrap_path)
-              log('Removed auto-generated bootstrap directory: %s', bootstrap_path)
+              shutil.rmtree(entry.path)
+              log('Removed auto-generated bootstrap directory: %s', entry.path)
               removed_count += 1
             except Exception as e:
-              err('Failed to remove auto-generated bootstrap directory %s: %s', bootstrap_path, e)
+              err('Failed to remove auto-generated bootstrap directory %s: %s', entry.path, e)
+
+          else:
+            stack.append(entry.path)
 
-      # Remove matching files
-      for filename in files:
-        if filename in files_to_remove:
-          file_path = os.path.join(root, filename)
+        # Remove matching files
+        elif entry.name in files_to_remove:
           try:
-            os.remove(file_path)
-            log('Removed file: %s', file_path)
-            removed_count += 1
+            os.remove(entry.path)
+            if debug:
+              logging.debug('Removed file: %s', entry.path)
+            local_n += 1
           except Exception as e:
-            err('Failed to remove file %s: %s', file_path, e)
+            err('Failed to remove file %s: %s', entry.path, e)
+
+      # One summary line per directory instead of one INFO record per file
+      if local_n:
+        log('Removed %d files under %s', local_n, root)
+        removed_count += local_n
 
     log('Clean completed. Removed %d items.', removed_count)
 
@@ -553,6 +775,7 @@ def parse_args(argv):
   parser.add_argument('--force-copy', action='store_true')
   parser.add_argument('--app-name', default='')
   parser.add_argument('--force', action='store_true')
+  parser.add_argument('--parallelism', type=int, default=PARALLELISM, help='Concurrent operations for terraform plan/apply/destroy')
   parser.add_argument('-v', '--version', action='version', version=f'%(prog)s {version.__version__}')
 
   args = parser.parse_args(argv)
@@ -569,22 +792,14 @@ def main(argv):
 
   command, args = parse_args(argv)
   wrapper = TfWrap(env=args.env, region=args.region, target_dir=args.target_dir)
-  wrapper.force_copy = args.force_copy
-  wrapper.app_name_override = args.app_name
-  wrapper.force_delete = args.force
-  wrapper.bucket_override = os.environ.get('BUCKET_OVERRIDE', '')
-  wrapper.force_copy = args.force_copy
-  wrapper.app_name_override = args.app_name
-  wrapper.force_delete = args.force
 
   # Propagate some flags
   wrapper.force_copy = args.force_copy
   wrapper.app_name_override = args.app_name
-  global FORCE_DELETE
+  wrapper.force_delete = args.force
+  wrapper.parallelism = args.parallelism
+  wrapper.bucket_override = os.environ.get('BUCKET_OVERRIDE', '')
   FORCE_DELETE = args.force
-  wrapper.force_copy = args.force_copy
-  wrapper.force_copy = args.force_copy
-  wrapper.force_copy = args.force_copy
 
   if command == 'bootstrap':
     # synthesize
@@ -601,13 +816,13 @@ def main(argv):
     wrapper.synthesize_app_name_and_account()
     wrapper.ensure_backend_via_ssm_or_bootstrap()
     wrapper.run_terraform_init_with_backend_file()
-    run_and_log(['terraform', 'plan', '-input=false', '-var', f'environment={wrapper.env}', '-var', f'region={wrapper.region}'], cwd=wrapper.target_dir)
+    run_and_log(['terraform', 'plan', '-input=false', f'-parallelism={wrapper.parallelism}', '-var', f'environment={wrapper.env}', '-var', f'region={wrapper.region}'], cwd=wrapper.target_dir)
   elif command == 'apply':
     # synthesize
     wrapper.synthesize_app_name_and_account()
     wrapper.ensure_backend_via_ssm_or_bootstrap()
     wrapper.run_terraform_init_with_backend_file()
-    run_and_log(['terraform', 'apply', '-auto-approve', '-input=false', '-var', f'environment={wrapper.env}', '-var', f'region={wrapper.region}'], cwd=wrapper.target_dir)
+    run_and_log(['terraform', 'apply', '-auto-approve', '-input=false', f'-parallelism={wrapper.parallelism}', '-var', f'environment={wrapper.env}', '-var', f'region={wrapper.region}'], cwd=wrapper.target_dir)
   elif command == 'destroy':
     # synthesize
     wrapper.synthesize_app_name_and_account()